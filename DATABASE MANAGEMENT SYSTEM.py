@@ -15,17 +15,36 @@ USE library_management_system;
 --  * Stores information about individual books.
 --  * book_id: Unique identifier for each book (Primary Key).
 --  * title: Title of the book.
---  * isbn: International Standard Book Number (Unique).
+--  * isbn: International Standard Book Number (Unique). Stored as
+--    fixed-width BINARY(13) — ISBN-13 is exactly 13 digits, and
+--    ISBN-10 (which may end in 'X') is zero-padded on the right.
+--    Fixed-width binary entries compare byte-for-byte and pack the
+--    unique index tighter than variable-length VARCHAR(20).
 --  * published_date: Date when the book was published.
 --  * publisher_id: Foreign Key referencing the Publishers table.
 -- -------------------------------------------------------------
 CREATE TABLE Books (
     book_id INT AUTO_INCREMENT PRIMARY KEY,
     title VARCHAR(255) NOT NULL,
-    isbn VARCHAR(20) NOT NULL UNIQUE,
+    isbn BINARY(13) NOT NULL UNIQUE,
     published_date DATE,
-    publisher_id INT,
-    INDEX (publisher_id) -- Add index on foreign key
+    publisher_id SMALLINT UNSIGNED, -- Matches the narrowed Publishers PK
+    is_available TINYINT(1) NOT NULL DEFAULT 1, -- Cached availability flag, maintained by Loans triggers
+    review_count INT NOT NULL DEFAULT 0, -- Cached count of reviews, maintained by triggers
+    rating_sum INT NOT NULL DEFAULT 0,   -- Cached sum of ratings, maintained by triggers
+    -- Average rating derived from the cached counters, so book pages
+    -- read it without aggregating the Reviews table.
+    avg_rating DECIMAL(3, 2) GENERATED ALWAYS AS (IF(review_count = 0, NULL, rating_sum / review_count)) VIRTUAL,
+    INDEX (publisher_id), -- Add index on foreign key
+    -- Prefix index for left-anchored title search (title LIKE 'foo%');
+    -- 64 chars covers typical titles while keeping the index small.
+    -- A prefix index can never be covering -- matching rows are still
+    -- fetched to read the full title -- but it narrows the scan from
+    -- the whole table to just the matching range.
+    INDEX idx_books_title_prefix (title(64)),
+    -- "Show available books ordered by title" becomes a range scan on
+    -- this index instead of an anti-join against open Loans rows.
+    INDEX idx_avail (is_available, title)
 );
 
 -- -------------------------------------------------------------
@@ -49,16 +68,21 @@ CREATE TABLE Authors (
 --  * A book can have multiple authors, and an author can write multiple books.
 --  * book_id: Foreign Key referencing the Books table.
 --  * author_id: Foreign Key referencing the Authors table.
+--  * author_display: Denormalized "First Last" copy of the author's
+--    name, kept in sync by triggers, so book listings read
+--    Books JOIN BookAuthors only instead of joining Authors as well.
 --  * Primary Key is a composite of (book_id, author_id).
 -- -------------------------------------------------------------
 CREATE TABLE BookAuthors (
     book_id INT,
     author_id INT,
+    author_display VARCHAR(201) NOT NULL DEFAULT '',
     PRIMARY KEY (book_id, author_id),
     FOREIGN KEY (book_id) REFERENCES Books(book_id),
     FOREIGN KEY (author_id) REFERENCES Authors(author_id),
-    INDEX (book_id), -- Add index on foreign key
-    INDEX (author_id)  -- Add index on foreign key
+    -- No separate book_id index: the PRIMARY KEY already leads on it.
+    INDEX (author_id),  -- Add index on foreign key
+    INDEX idx_book_display (book_id, author_display) -- Covering index for book listings
 );
 
 -- -------------------------------------------------------------
@@ -70,7 +94,7 @@ CREATE TABLE BookAuthors (
 --  * address: Address of the publisher.
 -- -------------------------------------------------------------
 CREATE TABLE Publishers (
-    publisher_id INT AUTO_INCREMENT PRIMARY KEY,
+    publisher_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY, -- SMALLINT: realistically O(1000) publishers; halves FK width
     name VARCHAR(255) NOT NULL,
     address VARCHAR(255)
 );
@@ -83,6 +107,12 @@ CREATE TABLE Publishers (
 --  * first_name: First name of the member.
 --  * last_name: Last name of the member.
 --  * email: Email address of the member (Unique).
+--  * email_hash: 8-byte hash of the lower-cased email. Uniqueness and
+--    login lookups go through this index — 8-byte entries instead of
+--    up-to-255-byte VARCHAR keys, and case-insensitive by
+--    construction. Lookups compare the hash first and re-check the
+--    email column to guard against the (negligible) collision case:
+--    WHERE email_hash = ? AND email = ?.
 --  * phone_number: Phone number of the member.
 --  * address: Address of the member.
 --  * membership_start_date: Date when the membership started.
@@ -91,10 +121,13 @@ CREATE TABLE Members (
     member_id INT AUTO_INCREMENT PRIMARY KEY,
     first_name VARCHAR(100) NOT NULL,
     last_name VARCHAR(100) NOT NULL,
-    email VARCHAR(255) NOT NULL UNIQUE,
+    email VARCHAR(255) NOT NULL,
+    email_hash BIGINT UNSIGNED GENERATED ALWAYS AS
+        (CAST(CONV(SUBSTRING(SHA2(LOWER(email), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
     phone_number VARCHAR(20),
     address VARCHAR(255),
-    membership_start_date DATE NOT NULL
+    membership_start_date DATE NOT NULL,
+    UNIQUE INDEX idx_email_hash (email_hash)
 );
 
 -- -------------------------------------------------------------
@@ -102,23 +135,53 @@ CREATE TABLE Members (
 -- -------------------------------------------------------------
 --  * Stores information about book loans.
 --  * loan_id: Unique identifier for each loan (Primary Key).
+--    Application-assigned, time-ordered 64-bit id (snowflake /
+--    UUIDv7 style, worker-id sharded) rather than AUTO_INCREMENT:
+--    concurrent checkouts from many branches no longer serialize on
+--    InnoDB's auto-increment lock, and inserts from different
+--    workers land on different B-tree leaf pages. (If reverting to
+--    AUTO_INCREMENT, set innodb_autoinc_lock_mode=2 in my.cnf —
+--    the MySQL 8 default — for interleaved allocation.)
 --  * book_id: Foreign Key referencing the Books table.
 --  * member_id: Foreign Key referencing the Members table.
 --  * loan_date: Date when the book was loaned.
 --  * return_date: Date when the book was returned (NULL if not returned).
 --  * due_date: Date when the book is due.
+--  * idx_loans_member_open resolves the hot "books this member still
+--    has out / which are overdue" predicate
+--    (member_id = ? AND return_date IS NULL AND due_date < CURDATE())
+--    entirely within the index, so no separate single-column
+--    member_id index is needed.
+--  * idx_loans_book_open likewise answers the availability check
+--    (book_id = ? AND return_date IS NULL) with a single index
+--    descent instead of fetching every historical loan row, and
+--    replaces the single-column book_id index.
+--  * Partitioned by RANGE on YEAR(loan_date) so date-windowed queries
+--    (active loans, yearly reports) prune old partitions entirely.
+--    The partitioning column must be part of the primary key, hence
+--    PRIMARY KEY (loan_id, loan_date).
+--  * NOTE: MySQL does not allow foreign keys on partitioned tables,
+--    so the book_id/member_id references are enforced by the
+--    application; the indexes for those lookups are kept.
 -- -------------------------------------------------------------
 CREATE TABLE Loans (
-    loan_id INT AUTO_INCREMENT PRIMARY KEY,
+    loan_id BIGINT UNSIGNED NOT NULL, -- Application-generated time-ordered id
     book_id INT,
     member_id INT,
     loan_date DATE NOT NULL,
     return_date DATE,
     due_date DATE NOT NULL,
-    FOREIGN KEY (book_id) REFERENCES Books(book_id),
-    FOREIGN KEY (member_id) REFERENCES Members(member_id),
-    INDEX (book_id), -- Add index on foreign key
-    INDEX (member_id)  -- Add index on foreign key
+    PRIMARY KEY (loan_id, loan_date),
+    INDEX idx_loans_book_open (book_id, return_date), -- Covers "is book X available?" checks
+    INDEX idx_loans_member_open (member_id, return_date, due_date)
+)
+PARTITION BY RANGE (YEAR(loan_date)) (
+    PARTITION p2022 VALUES LESS THAN (2023),
+    PARTITION p2023 VALUES LESS THAN (2024),
+    PARTITION p2024 VALUES LESS THAN (2025),
+    PARTITION p2025 VALUES LESS THAN (2026),
+    PARTITION p2026 VALUES LESS THAN (2027),
+    PARTITION pmax VALUES LESS THAN MAXVALUE
 );
 
 -- -------------------------------------------------------------
@@ -126,17 +189,40 @@ CREATE TABLE Loans (
 -- -------------------------------------------------------------
 --  * Stores information about fines for overdue books.
 --  * fine_id: Unique identifier for each fine (Primary Key).
---  * loan_id: Foreign Key referencing the Loans table.
+--  * Holds the "hot" fines: unpaid ones plus recently paid ones.
+--    Fines paid more than 30 days ago are moved to FineHistory by
+--    ArchivePaidFines, keeping this table (and its indexes) sized to
+--    the working set the dashboards actually scan.
+--  * loan_id: References the Loans table (no FK constraint: Loans is
+--    partitioned and cannot be the parent of a foreign key; enforced
+--    by the application).
 --  * amount: Amount of the fine.
 --  * payment_date: Date when the fine was paid (NULL if not paid).
 -- -------------------------------------------------------------
 CREATE TABLE Fines (
     fine_id INT AUTO_INCREMENT PRIMARY KEY,
-    loan_id INT,
+    loan_id BIGINT UNSIGNED, -- Matches the widened Loans.loan_id
     amount DECIMAL(10, 2) NOT NULL,
     payment_date DATE,
-    FOREIGN KEY (loan_id) REFERENCES Loans(loan_id),
-    INDEX (loan_id)  -- Add index on foreign key
+    INDEX (loan_id)  -- Add index on the loan reference
+);
+
+-- -------------------------------------------------------------
+--  Table: FineHistory (Cold Archive)
+-- -------------------------------------------------------------
+--  * Archive of settled fines, moved out of Fines so that the
+--    "outstanding fines" queries scan only the small hot table.
+--    Historical audit reports query this table explicitly.
+--  * Same shape as Fines; fine_id values are carried over, so there
+--    is no AUTO_INCREMENT here and payment_date is always set.
+-- -------------------------------------------------------------
+CREATE TABLE FineHistory (
+    fine_id INT PRIMARY KEY,
+    loan_id BIGINT UNSIGNED, -- Matches the widened Loans.loan_id
+    amount DECIMAL(10, 2) NOT NULL,
+    payment_date DATE NOT NULL,
+    INDEX (loan_id),  -- Add index on the loan reference
+    INDEX (payment_date) -- For year/period audit reports
 );
 
 -- -------------------------------------------------------------
@@ -147,18 +233,24 @@ CREATE TABLE Fines (
 --  * book_id: Foreign Key referencing the Books table.
 --  * member_id: Foreign Key referencing the Members table.
 --  * reservation_date: Date when the reservation was made.
---  * status: Status of the reservation (e.g., 'Pending', 'Active', 'Cancelled', 'Completed').
+--  * status: Status of the reservation, stored as a TINYINT code
+--    (0 = Pending, 1 = Active, 2 = Cancelled, 3 = Completed).
 -- -------------------------------------------------------------
 CREATE TABLE BookReservations (
     reservation_id INT AUTO_INCREMENT PRIMARY KEY,
     book_id INT,
     member_id INT,
     reservation_date DATE NOT NULL,
-    status ENUM('Pending', 'Active', 'Cancelled', 'Completed') NOT NULL DEFAULT 'Pending',
+    status TINYINT UNSIGNED NOT NULL DEFAULT 0, -- 0=Pending, 1=Active, 2=Cancelled, 3=Completed
     FOREIGN KEY (book_id) REFERENCES Books(book_id),
     FOREIGN KEY (member_id) REFERENCES Members(member_id),
-    INDEX (book_id),  -- Add index on foreign key
-    INDEX (member_id)   -- Add index on foreign key
+    INDEX idx_res_book_status (book_id, status), -- Covers reservation conflict checks; also serves the FK
+    INDEX (member_id),   -- Add index on foreign key
+    -- At most one live (Pending/Active) reservation per book and member,
+    -- enforced in the schema instead of a racy SELECT-then-INSERT in the
+    -- application. The expression is NULL for Cancelled/Completed rows,
+    -- and NULLs may repeat in a unique index, so history is unaffected.
+    UNIQUE INDEX uq_active_reservation ((IF(status IN (0, 1), CONCAT(book_id, '-', member_id), NULL)))
 );
 
 -- -------------------------------------------------------------
@@ -169,7 +261,7 @@ CREATE TABLE BookReservations (
 --  * name: Name of the category (e.g., 'Fiction', 'Sci-Fi', 'History').
 -- -------------------------------------------------------------
 CREATE TABLE Categories (
-    category_id INT AUTO_INCREMENT PRIMARY KEY,
+    category_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY, -- SMALLINT: realistically O(100) categories; halves FK width
     name VARCHAR(100) NOT NULL UNIQUE
 );
 
@@ -184,11 +276,11 @@ CREATE TABLE Categories (
 -- -------------------------------------------------------------
 CREATE TABLE BookCategories (
     book_id INT,
-    category_id INT,
+    category_id SMALLINT UNSIGNED, -- Matches the narrowed Categories PK
     PRIMARY KEY (book_id, category_id),
     FOREIGN KEY (book_id) REFERENCES Books(book_id),
     FOREIGN KEY (category_id) REFERENCES Categories(category_id),
-    INDEX (book_id),   -- Add index on foreign key
+    -- No separate book_id index: the PRIMARY KEY already leads on it.
     INDEX (category_id)    -- Add index on foreign key
 );
 
@@ -200,19 +292,30 @@ CREATE TABLE BookCategories (
 --  * book_id: Foreign Key referencing the Books table.
 --  * member_id: Foreign Key referencing the Members table.
 --  * rating: Rating given by the member (e.g., 1 to 5 stars).
---  * comment: Text of the review.
---  * review_date: Date when the review was submitted.
+--  * comment: Text of the review. VARCHAR rather than TEXT so the
+--    value stays in-row in InnoDB instead of spilling to an
+--    off-page blob that costs an extra page fetch per row.
+--  * review_epoch: Submission time as Unix epoch seconds — the
+--    stored/indexed form, so time-range predicates are plain integer
+--    compares with no per-row timezone conversion.
+--  * review_date: Readable timestamp derived from review_epoch,
+--    kept for backward compatibility with existing queries.
+--  * idx_book_rating covers book-page review listings and
+--    average-rating aggregations without touching table rows;
+--    idx_book_review_time serves "reviews for book X in period Y".
 -- -------------------------------------------------------------
 CREATE TABLE Reviews (
     review_id INT AUTO_INCREMENT PRIMARY KEY,
     book_id INT,
     member_id INT,
     rating INT NOT NULL CHECK (rating >= 1 AND rating <= 5),
-    comment TEXT,
-    review_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    comment VARCHAR(2000),
+    review_epoch BIGINT NOT NULL DEFAULT (UNIX_TIMESTAMP()),
+    review_date TIMESTAMP GENERATED ALWAYS AS (FROM_UNIXTIME(review_epoch)) VIRTUAL,
     FOREIGN KEY (book_id) REFERENCES Books(book_id),
     FOREIGN KEY (member_id) REFERENCES Members(member_id),
-    INDEX (book_id),  -- Add index on foreign key
+    INDEX idx_book_rating (book_id, rating, review_epoch DESC), -- Covering; also serves the FK
+    INDEX idx_book_review_time (book_id, review_epoch),
     INDEX (member_id)   -- Add index on foreign key
 );
 
@@ -224,6 +327,8 @@ CREATE TABLE Reviews (
 --  * first_name: First name of the staff member.
 --  * last_name: Last name of the staff member.
 --  * email: Email address of the staff member (Unique).
+--  * email_hash: 8-byte hash of the lower-cased email; same scheme
+--    as Members.email_hash (see that table for the lookup pattern).
 --  * phone_number: Phone number of the staff member.
 --  * job_title: Job title of the staff member.
 --  * hire_date: Date when the staff member was hired.
@@ -232,10 +337,13 @@ CREATE TABLE LibraryStaff (
     staff_id INT AUTO_INCREMENT PRIMARY KEY,
     first_name VARCHAR(100) NOT NULL,
     last_name VARCHAR(100) NOT NULL,
-    email VARCHAR(255) NOT NULL UNIQUE,
+    email VARCHAR(255) NOT NULL,
+    email_hash BIGINT UNSIGNED GENERATED ALWAYS AS
+        (CAST(CONV(SUBSTRING(SHA2(LOWER(email), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
     phone_number VARCHAR(20),
     job_title VARCHAR(100),
-    hire_date DATE NOT NULL
+    hire_date DATE NOT NULL,
+    UNIQUE INDEX idx_email_hash (email_hash)
 );
 
 -- -------------------------------------------------------------
@@ -246,7 +354,7 @@ CREATE TABLE LibraryStaff (
 --    * role_name: Name of the role.
 -- -------------------------------------------------------------
 CREATE TABLE StaffRoles (
-  role_id INT AUTO_INCREMENT PRIMARY KEY,
+  role_id TINYINT UNSIGNED AUTO_INCREMENT PRIMARY KEY, -- TINYINT: a handful of roles; shrinks every junction entry
   role_name VARCHAR(255) NOT NULL UNIQUE
 );
 
@@ -259,11 +367,11 @@ CREATE TABLE StaffRoles (
 -- -------------------------------------------------------------
 CREATE TABLE LibraryStaffRoles (
     staff_id INT,
-    role_id INT,
+    role_id TINYINT UNSIGNED, -- Matches the narrowed StaffRoles PK
     PRIMARY KEY (staff_id, role_id),
     FOREIGN KEY (staff_id) REFERENCES LibraryStaff(staff_id),
     FOREIGN KEY (role_id) REFERENCES StaffRoles(role_id),
-    INDEX (staff_id),  -- Add index on foreign key
+    -- No separate staff_id index: the PRIMARY KEY already leads on it.
     INDEX (role_id)   -- Add index on foreign key
 );
 
@@ -277,10 +385,10 @@ CREATE TABLE LibraryStaffRoles (
 --  * description: Description of the setting.
 -- -------------------------------------------------------------
 CREATE TABLE SystemSettings (
-    setting_id INT AUTO_INCREMENT PRIMARY KEY,
+    setting_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY, -- SMALLINT: bounded set of settings
     setting_name VARCHAR(255) NOT NULL UNIQUE,
     setting_value VARCHAR(255),
-    description TEXT
+    description VARCHAR(1000) -- Bounded VARCHAR keeps the value in-row
 );
 
 -- -------------------------------------------------------------
@@ -288,23 +396,487 @@ CREATE TABLE SystemSettings (
 -- -------------------------------------------------------------
 --  * Stores notifications for members and staff.
 --  * notification_id: Unique identifier for each notification.
---  * recipient_id: ID of the recipient (can be member_id or staff_id).
---  * recipient_type: Type of recipient ('Member' or 'Staff').
+--  * member_id / staff_id: Exactly one is set, identifying the
+--    recipient with a real foreign key (replaces the old untyped
+--    recipient_id + recipient_type pair, which had no FK and gave
+--    the optimizer no cardinality information).
 --  * message: Content of the notification.
 --  * notification_date: Date and time when the notification was created.
---  * status: Status of the notification (e.g., 'Sent', 'Read', 'Archived').
+--  * status: Status of the notification, stored as a TINYINT code
+--    (0 = Sent, 1 = Read, 2 = Archived).
+--  * The per-recipient composite indexes cover the hot "unread
+--    notifications for recipient X" query entirely from the index,
+--    including the ORDER BY notification_date.
 -- -------------------------------------------------------------
 CREATE TABLE Notifications (
     notification_id INT AUTO_INCREMENT PRIMARY KEY,
-    recipient_id INT,
-    recipient_type ENUM('Member', 'Staff') NOT NULL,
-    message TEXT NOT NULL,
+    member_id INT NULL,
+    staff_id INT NULL,
+    message VARCHAR(2000) NOT NULL, -- Bounded VARCHAR keeps the value in-row
     notification_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    status ENUM('Sent', 'Read', 'Archived') NOT NULL DEFAULT 'Sent',
-    INDEX (recipient_id),
-    INDEX (recipient_type)
+    status TINYINT UNSIGNED NOT NULL DEFAULT 0, -- 0=Sent, 1=Read, 2=Archived
+    CONSTRAINT chk_one_recipient CHECK ((member_id IS NOT NULL) <> (staff_id IS NOT NULL)),
+    FOREIGN KEY (member_id) REFERENCES Members(member_id),
+    FOREIGN KEY (staff_id) REFERENCES LibraryStaff(staff_id),
+    INDEX idx_notif_member (member_id, status, notification_date),
+    INDEX idx_notif_staff (staff_id, status, notification_date)
+);
+
+-- -------------------------------------------------------------
+--  Table: MemberLoanSummary (Materialized Summary)
+-- -------------------------------------------------------------
+--  * Trigger-maintained summary of loan/fine activity per member.
+--  * Dashboards read one row per member instead of aggregating
+--    the Loans and Fines tables on every request.
+--  * member_id: Foreign Key referencing the Members table (Primary Key).
+--  * active_loans: Number of loans not yet returned.
+--  * overdue_count: Number of active loans past their due date
+--    (recomputed by RefreshMemberLoanSummary, as it is time-dependent).
+--  * total_unpaid_fines: Sum of unpaid fine amounts for the member.
+--  * last_refreshed: When the row was last touched.
+-- -------------------------------------------------------------
+CREATE TABLE MemberLoanSummary (
+    member_id INT PRIMARY KEY,
+    active_loans INT NOT NULL DEFAULT 0,
+    overdue_count INT NOT NULL DEFAULT 0,
+    total_unpaid_fines DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+    last_refreshed DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (member_id) REFERENCES Members(member_id)
+);
+
+-- -------------------------------------------------------------
+--  Initial Population: MemberLoanSummary
+-- -------------------------------------------------------------
+--  * Backfills one summary row per member from existing data.
+--  * Safe to re-run on an already-populated database.
+-- -------------------------------------------------------------
+INSERT INTO MemberLoanSummary (member_id, active_loans, overdue_count, total_unpaid_fines)
+SELECT m.member_id,
+       COALESCE(SUM(l.return_date IS NULL), 0),
+       COALESCE(SUM(l.return_date IS NULL AND l.due_date < CURDATE()), 0),
+       COALESCE((SELECT SUM(f.amount)
+                 FROM Fines f
+                 JOIN Loans fl ON fl.loan_id = f.loan_id
+                 WHERE fl.member_id = m.member_id
+                   AND f.payment_date IS NULL), 0.00)
+FROM Members m
+LEFT JOIN Loans l ON l.member_id = m.member_id
+GROUP BY m.member_id
+ON DUPLICATE KEY UPDATE
+    active_loans = VALUES(active_loans),
+    overdue_count = VALUES(overdue_count),
+    total_unpaid_fines = VALUES(total_unpaid_fines);
+
+-- -------------------------------------------------------------
+--  Triggers: MemberLoanSummary Maintenance
+-- -------------------------------------------------------------
+--  * Keep the summary table in sync incrementally as loans are
+--    created/returned and fines are created/paid, so reads never
+--    have to aggregate the base tables.
+--  * overdue_count is time-dependent (due_date < CURDATE()), so
+--    it is recomputed by RefreshMemberLoanSummary below rather
+--    than maintained per-row.
+-- -------------------------------------------------------------
+DELIMITER $$
+
+CREATE TRIGGER trg_loans_ai_summary
+AFTER INSERT ON Loans
+FOR EACH ROW
+BEGIN
+    IF NEW.return_date IS NULL THEN
+        INSERT INTO MemberLoanSummary (member_id, active_loans)
+        VALUES (NEW.member_id, 1)
+        ON DUPLICATE KEY UPDATE active_loans = active_loans + 1;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_loans_au_summary
+AFTER UPDATE ON Loans
+FOR EACH ROW
+BEGIN
+    IF OLD.return_date IS NULL AND NEW.return_date IS NOT NULL THEN
+        UPDATE MemberLoanSummary
+        SET active_loans = active_loans - 1
+        WHERE member_id = NEW.member_id;
+    ELSEIF OLD.return_date IS NOT NULL AND NEW.return_date IS NULL THEN
+        UPDATE MemberLoanSummary
+        SET active_loans = active_loans + 1
+        WHERE member_id = NEW.member_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_loans_ad_summary
+AFTER DELETE ON Loans
+FOR EACH ROW
+BEGIN
+    IF OLD.return_date IS NULL THEN
+        UPDATE MemberLoanSummary
+        SET active_loans = active_loans - 1
+        WHERE member_id = OLD.member_id;
+    END IF;
+END$$
+
+-- The fine triggers upsert (like trg_loans_ai_summary above) rather
+-- than update, so a member whose summary row does not exist yet --
+-- e.g. all their loans were imported already returned -- still gets
+-- their balance tracked instead of the update silently no-opping.
+CREATE TRIGGER trg_fines_ai_summary
+AFTER INSERT ON Fines
+FOR EACH ROW
+BEGIN
+    IF NEW.payment_date IS NULL THEN
+        INSERT INTO MemberLoanSummary (member_id, total_unpaid_fines)
+        SELECT member_id, NEW.amount FROM Loans WHERE loan_id = NEW.loan_id
+        ON DUPLICATE KEY UPDATE total_unpaid_fines = total_unpaid_fines + NEW.amount;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_fines_au_summary
+AFTER UPDATE ON Fines
+FOR EACH ROW
+BEGIN
+    IF OLD.payment_date IS NULL AND NEW.payment_date IS NOT NULL THEN
+        INSERT INTO MemberLoanSummary (member_id, total_unpaid_fines)
+        SELECT member_id, 0 FROM Loans WHERE loan_id = NEW.loan_id
+        ON DUPLICATE KEY UPDATE total_unpaid_fines = total_unpaid_fines - OLD.amount;
+    ELSEIF OLD.payment_date IS NOT NULL AND NEW.payment_date IS NULL THEN
+        INSERT INTO MemberLoanSummary (member_id, total_unpaid_fines)
+        SELECT member_id, NEW.amount FROM Loans WHERE loan_id = NEW.loan_id
+        ON DUPLICATE KEY UPDATE total_unpaid_fines = total_unpaid_fines + NEW.amount;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_fines_ad_summary
+AFTER DELETE ON Fines
+FOR EACH ROW
+BEGIN
+    IF OLD.payment_date IS NULL THEN
+        INSERT INTO MemberLoanSummary (member_id, total_unpaid_fines)
+        SELECT member_id, 0 FROM Loans WHERE loan_id = OLD.loan_id
+        ON DUPLICATE KEY UPDATE total_unpaid_fines = total_unpaid_fines - OLD.amount;
+    END IF;
+END$$
+
+-- -------------------------------------------------------------
+--  Procedure: RefreshMemberLoanSummary
+-- -------------------------------------------------------------
+--  * Recomputes overdue_count, which drifts as loans cross their
+--    due date with no row being written. Intended to be run from
+--    a scheduled event (e.g. nightly).
+-- -------------------------------------------------------------
+CREATE PROCEDURE RefreshMemberLoanSummary()
+BEGIN
+    UPDATE MemberLoanSummary s
+    SET s.overdue_count = (
+        SELECT COALESCE(SUM(l.return_date IS NULL AND l.due_date < CURDATE()), 0)
+        FROM Loans l
+        WHERE l.member_id = s.member_id
+    );
+END$$
+
+-- -------------------------------------------------------------
+--  Triggers: BookAuthors.author_display Maintenance
+-- -------------------------------------------------------------
+--  * author_display is filled automatically when a book/author link
+--    is created, and propagated when an author is renamed, so the
+--    application never writes it directly.
+-- -------------------------------------------------------------
+CREATE TRIGGER trg_bookauthors_bi_display
+BEFORE INSERT ON BookAuthors
+FOR EACH ROW
+BEGIN
+    SET NEW.author_display = (
+        SELECT CONCAT(a.first_name, ' ', a.last_name)
+        FROM Authors a
+        WHERE a.author_id = NEW.author_id
+    );
+END$$
+
+CREATE TRIGGER trg_authors_au_display
+AFTER UPDATE ON Authors
+FOR EACH ROW
+BEGIN
+    IF NEW.first_name <> OLD.first_name OR NEW.last_name <> OLD.last_name THEN
+        UPDATE BookAuthors
+        SET author_display = CONCAT(NEW.first_name, ' ', NEW.last_name)
+        WHERE author_id = NEW.author_id;
+    END IF;
+END$$
+
+DELIMITER ;
+
+-- -------------------------------------------------------------
+--  Backfill: BookAuthors.author_display
+-- -------------------------------------------------------------
+--  * Re-syncs the denormalized column from Authors. Safe to re-run
+--    on an already-populated database.
+-- -------------------------------------------------------------
+UPDATE BookAuthors ba
+JOIN Authors a ON a.author_id = ba.author_id
+SET ba.author_display = CONCAT(a.first_name, ' ', a.last_name);
+
+-- -------------------------------------------------------------
+--  Triggers: Books Availability Cache Maintenance
+-- -------------------------------------------------------------
+--  * Keep Books.is_available in step with open Loans so "show only
+--    available books" reads the flag instead of running a NOT EXISTS
+--    probe against Loans per book.
+--  * On return/delete the flag is recomputed from remaining open
+--    loans rather than blindly set, so overlapping loan rows (e.g.
+--    data fixes) cannot leave it wrong.
+-- -------------------------------------------------------------
+DELIMITER $$
+
+CREATE TRIGGER trg_loans_ai_avail
+AFTER INSERT ON Loans
+FOR EACH ROW
+BEGIN
+    IF NEW.return_date IS NULL THEN
+        UPDATE Books SET is_available = 0 WHERE book_id = NEW.book_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_loans_au_avail
+AFTER UPDATE ON Loans
+FOR EACH ROW
+BEGIN
+    IF OLD.return_date IS NULL AND NEW.return_date IS NOT NULL THEN
+        UPDATE Books
+        SET is_available = NOT EXISTS (
+            SELECT 1 FROM Loans
+            WHERE book_id = NEW.book_id AND return_date IS NULL
+        )
+        WHERE book_id = NEW.book_id;
+    ELSEIF OLD.return_date IS NOT NULL AND NEW.return_date IS NULL THEN
+        UPDATE Books SET is_available = 0 WHERE book_id = NEW.book_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_loans_ad_avail
+AFTER DELETE ON Loans
+FOR EACH ROW
+BEGIN
+    IF OLD.return_date IS NULL THEN
+        UPDATE Books
+        SET is_available = NOT EXISTS (
+            SELECT 1 FROM Loans
+            WHERE book_id = OLD.book_id AND return_date IS NULL
+        )
+        WHERE book_id = OLD.book_id;
+    END IF;
+END$$
+
+DELIMITER ;
+
+-- -------------------------------------------------------------
+--  Triggers: Books Rating Cache Maintenance
+-- -------------------------------------------------------------
+--  * Keep Books.review_count / rating_sum in step with Reviews so
+--    "avg rating X from N reviews" is an O(1) read off the Books row
+--    instead of an aggregate over all reviews for the book.
+-- -------------------------------------------------------------
+DELIMITER $$
+
+CREATE TRIGGER trg_reviews_ai_rating
+AFTER INSERT ON Reviews
+FOR EACH ROW
+BEGIN
+    UPDATE Books
+    SET review_count = review_count + 1,
+        rating_sum = rating_sum + NEW.rating
+    WHERE book_id = NEW.book_id;
+END$$
+
+CREATE TRIGGER trg_reviews_au_rating
+AFTER UPDATE ON Reviews
+FOR EACH ROW
+BEGIN
+    IF NEW.rating <> OLD.rating THEN
+        UPDATE Books
+        SET rating_sum = rating_sum + NEW.rating - OLD.rating
+        WHERE book_id = NEW.book_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_reviews_ad_rating
+AFTER DELETE ON Reviews
+FOR EACH ROW
+BEGIN
+    UPDATE Books
+    SET review_count = review_count - 1,
+        rating_sum = rating_sum - OLD.rating
+    WHERE book_id = OLD.book_id;
+END$$
+
+DELIMITER ;
+
+-- -------------------------------------------------------------
+--  View: v_book_with_authors
+-- -------------------------------------------------------------
+--  * One row per book with all author names concatenated, from the
+--    canonical Authors table. Applications query this view instead
+--    of re-inventing the three-way join.
+--  * STRAIGHT_JOIN pins the Books -> BookAuthors -> Authors join
+--    order, which is the known-good plan; with stale statistics the
+--    optimizer occasionally drives from Authors and picks a far
+--    slower nested-loop order.
+-- -------------------------------------------------------------
+CREATE VIEW v_book_with_authors AS
+SELECT STRAIGHT_JOIN
+    b.book_id,
+    b.title,
+    b.isbn,
+    GROUP_CONCAT(CONCAT(a.first_name, ' ', a.last_name)
+                 ORDER BY a.last_name, a.first_name
+                 SEPARATOR ', ') AS authors
+FROM Books b
+JOIN BookAuthors ba ON ba.book_id = b.book_id
+JOIN Authors a ON a.author_id = ba.author_id
+GROUP BY b.book_id, b.title, b.isbn;
+
+-- -------------------------------------------------------------
+--  Procedures: Batch Lookups
+-- -------------------------------------------------------------
+--  * Fetch many rows by id in a single round-trip instead of one
+--    query per id (the N+1 pattern). Callers pass a JSON array of
+--    ids, e.g. CALL GetBooksByIds('[1, 2, 3]').
+--  * JSON_TABLE expands the array into rows so each id is still a
+--    primary-key lookup rather than a full scan.
+-- -------------------------------------------------------------
+DELIMITER $$
+
+CREATE PROCEDURE GetBooksByIds(IN ids JSON)
+BEGIN
+    SELECT b.*, p.name AS publisher_name
+    FROM JSON_TABLE(ids, '$[*]' COLUMNS (book_id INT PATH '$')) AS req
+    JOIN Books b ON b.book_id = req.book_id
+    LEFT JOIN Publishers p ON p.publisher_id = b.publisher_id;
+END$$
+
+CREATE PROCEDURE GetMembersByIds(IN ids JSON)
+BEGIN
+    SELECT m.*
+    FROM JSON_TABLE(ids, '$[*]' COLUMNS (member_id INT PATH '$')) AS req
+    JOIN Members m ON m.member_id = req.member_id;
+END$$
+
+-- -------------------------------------------------------------
+--  Procedure: ArchivePaidFines
+-- -------------------------------------------------------------
+--  * Moves fines settled more than 30 days ago from Fines into
+--    FineHistory. Intended to be run from a scheduled event (e.g.
+--    nightly); safe to re-run at any time.
+--  * The cutoff is captured once (so a run straddling midnight
+--    cannot delete rows the insert never saw), the delete targets
+--    exactly the rows present in FineHistory, INSERT IGNORE makes
+--    a re-run after a crash idempotent, and insert+delete commit
+--    as one transaction.
+-- -------------------------------------------------------------
+CREATE PROCEDURE ArchivePaidFines()
+BEGIN
+    DECLARE cutoff DATE DEFAULT (CURDATE() - INTERVAL 30 DAY);
+
+    START TRANSACTION;
+
+    INSERT IGNORE INTO FineHistory (fine_id, loan_id, amount, payment_date)
+    SELECT fine_id, loan_id, amount, payment_date
+    FROM Fines
+    WHERE payment_date IS NOT NULL
+      AND payment_date < cutoff;
+
+    DELETE f FROM Fines f
+    JOIN FineHistory h ON h.fine_id = f.fine_id;
+
+    COMMIT;
+END$$
+
+DELIMITER ;
+
+-- -------------------------------------------------------------
+--  Table: mv_available_books (Materialized Catalog Projection)
+-- -------------------------------------------------------------
+--  * Pre-joined projection of the catalog browse query: available
+--    books with author, category and publisher names, one row per
+--    (book, author, category) combination. Browsing "available books
+--    in category X by author Y" reads this table's indexes directly
+--    instead of joining five tables per request.
+--  * Kept in sync per book by RefreshBookProjection, called from
+--    triggers on Books availability changes and on BookAuthors /
+--    BookCategories links.
+-- -------------------------------------------------------------
+CREATE TABLE mv_available_books (
+    book_id INT NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    isbn BINARY(13) NOT NULL,
+    author_display VARCHAR(201),
+    category VARCHAR(100),
+    publisher VARCHAR(255),
+    INDEX idx_mv_book (book_id), -- For targeted per-book refresh
+    INDEX idx_mv_category (category, title),
+    INDEX idx_mv_author (author_display)
 );
 
+DELIMITER $$
+
+-- -------------------------------------------------------------
+--  Procedure: RefreshBookProjection
+-- -------------------------------------------------------------
+--  * Rebuilds the mv_available_books rows for a single book. Cheap
+--    (a handful of rows per book) and idempotent, so triggers call
+--    it on any change that affects the projection.
+-- -------------------------------------------------------------
+CREATE PROCEDURE RefreshBookProjection(IN p_book_id INT)
+BEGIN
+    DELETE FROM mv_available_books WHERE book_id = p_book_id;
+
+    INSERT INTO mv_available_books (book_id, title, isbn, author_display, category, publisher)
+    SELECT b.book_id, b.title, b.isbn, ba.author_display, c.name, p.name
+    FROM Books b
+    LEFT JOIN BookAuthors ba ON ba.book_id = b.book_id
+    LEFT JOIN BookCategories bc ON bc.book_id = b.book_id
+    LEFT JOIN Categories c ON c.category_id = bc.category_id
+    LEFT JOIN Publishers p ON p.publisher_id = b.publisher_id
+    WHERE b.book_id = p_book_id
+      AND b.is_available = 1;
+END$$
+
+-- -------------------------------------------------------------
+--  Triggers: mv_available_books Maintenance
+-- -------------------------------------------------------------
+CREATE TRIGGER trg_books_ai_projection
+AFTER INSERT ON Books
+FOR EACH ROW
+BEGIN
+    CALL RefreshBookProjection(NEW.book_id);
+END$$
+
+CREATE TRIGGER trg_books_au_projection
+AFTER UPDATE ON Books
+FOR EACH ROW
+BEGIN
+    IF NEW.is_available <> OLD.is_available
+       OR NEW.title <> OLD.title
+       OR NEW.isbn <> OLD.isbn THEN
+        CALL RefreshBookProjection(NEW.book_id);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_bookauthors_ai_projection
+AFTER INSERT ON BookAuthors
+FOR EACH ROW
+BEGIN
+    CALL RefreshBookProjection(NEW.book_id);
+END$$
+
+CREATE TRIGGER trg_bookcategories_ai_projection
+AFTER INSERT ON BookCategories
+FOR EACH ROW
+BEGIN
+    CALL RefreshBookProjection(NEW.book_id);
+END$$
+
+DELIMITER ;
+
 -- -------------------------------------------------------------
 --  Foreign Key Constraints (Adding them after table creation)
 -- -------------------------------------------------------------